@@ -87,7 +87,7 @@ def __getattr__(name):
     obj_mod = _lazy_imports_obj.get(name)
     if obj_mod is not None:
         mod = importlib.import_module(obj_mod)
-        return mod.__dict__[name]
+        return getattr(mod, name)
 
     lazy_mod = _lazy_imports_mod.get(name)
     if lazy_mod is not None:
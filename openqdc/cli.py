@@ -189,6 +189,13 @@ def preprocess(
             help="Whether to preprocess as a zarr format or a memmap format.",
         ),
     ] = False,
+    cache_raw_entries: Annotated[
+        bool,
+        typer.Option(
+            help="Whether to cache the parsed raw files on disk to speed up later preprocessing. "
+            + "The cache in <root>/raw_entries/<name> has to be removed after changing the reader code.",
+        ),
+    ] = False,
 ):
     """
     Preprocess a raw dataset (previously fetched) into a openqdc dataset and optionally push it to remote.
@@ -200,7 +207,9 @@ def preprocess(
         if exist_dataset(dataset):
             logger.info(f"Preprocessing {SANITIZED_AVAILABLE_DATASETS[dataset].__name__}")
             try:
-                SANITIZED_AVAILABLE_DATASETS[dataset].no_init().preprocess(upload=upload, overwrite=overwrite)
+                SANITIZED_AVAILABLE_DATASETS[dataset].no_init().preprocess(
+                    upload=upload, overwrite=overwrite, cache_raw_entries=cache_raw_entries
+                )
             except Exception as e:
                 logger.error(f"Error while preprocessing {dataset}. {e}. Did you fetch the dataset first?")
                 raise e
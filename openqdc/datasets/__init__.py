@@ -1,7 +1,20 @@
-from .interaction import *
-from .potential import *
+import importlib
+import os
+from typing import TYPE_CHECKING
 
-AVAILABLE_DATASETS = {**AVAILABLE_POTENTIAL_DATASETS, **AVAILABLE_INTERACTION_DATASETS}
+from .interaction import _lazy_imports_obj as _interaction_imports_obj
+from .potential import _lazy_imports_obj as _potential_imports_obj
+
+# read once at import time, everything is imported right away when lazy loading is disabled
+_EAGER = os.environ.get("OPENQDC_DISABLE_LAZY_LOADING") == "1"
+
+# Dictionary of objects to lazily import; maps the object's name to its module path
+_lazy_imports_obj = {
+    **_potential_imports_obj,
+    **_interaction_imports_obj,
+    "AVAILABLE_POTENTIAL_DATASETS": "openqdc.datasets.potential",
+    "AVAILABLE_INTERACTION_DATASETS": "openqdc.datasets.interaction",
+}
 
 
 def _level_of_theory_overlap(dataset_collection):
@@ -24,5 +37,50 @@ def _level_of_theory_overlap(dataset_collection):
     return dict(filter(lambda x: len(x[1]) > 1, common_values_dict.items()))
 
 
-COMMON_MAP_POTENTIALS = _level_of_theory_overlap(AVAILABLE_POTENTIAL_DATASETS)
-COMMON_MAP_INTERACTIONS = _level_of_theory_overlap(AVAILABLE_INTERACTION_DATASETS)
+# Collections built from all the datasets, computed on first access
+_lazy_collections = {
+    "AVAILABLE_DATASETS": lambda: {
+        **__getattr__("AVAILABLE_POTENTIAL_DATASETS"),
+        **__getattr__("AVAILABLE_INTERACTION_DATASETS"),
+    },
+    "COMMON_MAP_POTENTIALS": lambda: _level_of_theory_overlap(__getattr__("AVAILABLE_POTENTIAL_DATASETS")),
+    "COMMON_MAP_INTERACTIONS": lambda: _level_of_theory_overlap(__getattr__("AVAILABLE_INTERACTION_DATASETS")),
+}
+
+__all__ = [*_lazy_imports_obj, *_lazy_collections]
+
+
+def __getattr__(name):
+    """Lazily import objects from _lazy_imports_obj or build the collections of _lazy_collections
+
+    Note that this method is only called by Python if the name cannot be found
+    in the current module."""
+    obj_mod = _lazy_imports_obj.get(name)
+    if obj_mod is not None:
+        mod = importlib.import_module(obj_mod)
+        globals()[name] = getattr(mod, name)
+        return globals()[name]
+
+    build_collection = _lazy_collections.get(name)
+    if build_collection is not None:
+        globals()[name] = build_collection()
+        return globals()[name]
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Add _lazy_imports_obj and _lazy_collections to dir(<module>)"""
+    # a set since the lazy names cached in globals() would otherwise be listed twice
+    return sorted({*globals(), *_lazy_imports_obj, *_lazy_collections})
+
+
+if TYPE_CHECKING or _EAGER:
+    # These types are imported lazily at runtime, but we need to tell type
+    # checkers what they are.
+    from .interaction import *
+    from .potential import *
+
+    AVAILABLE_DATASETS = {**AVAILABLE_POTENTIAL_DATASETS, **AVAILABLE_INTERACTION_DATASETS}
+    COMMON_MAP_POTENTIALS = _level_of_theory_overlap(AVAILABLE_POTENTIAL_DATASETS)
+    COMMON_MAP_INTERACTIONS = _level_of_theory_overlap(AVAILABLE_INTERACTION_DATASETS)
@@ -35,6 +35,7 @@ from openqdc.utils.exceptions import (
     StatisticsNotAvailableError,
 )
 from openqdc.utils.io import (
+    cached_raw_entries,
     copy_exists,
     dict_to_atoms,
     get_local_cache,
@@ -383,6 +384,8 @@ class BaseDataset(DatasetPropertyMixIn):
     def read_raw_entries(self):
         """
         Preprocess the raw (aka from the fetched source) into a list of dictionaries.
+        Fields that are constant over an entry (e.g. name, subset) can be read-only views created
+        with np.broadcast_to, they are only materialized when the entries are collated.
         """
         raise NotImplementedError
 
@@ -491,7 +494,9 @@ class BaseDataset(DatasetPropertyMixIn):
         predicats += [copy_exists(p_join(self.preprocess_path, file)) for file in self.dataset_wrapper._extra_files]
         return all(predicats)
 
-    def preprocess(self, upload: bool = False, overwrite: bool = True, as_zarr: bool = True):
+    def preprocess(
+        self, upload: bool = False, overwrite: bool = True, as_zarr: bool = True, cache_raw_entries: bool = False
+    ):
         """
         Preprocess the dataset and save it.
 
@@ -503,12 +508,53 @@ class BaseDataset(DatasetPropertyMixIn):
                 Only used if upload is True. Cache is always overwritten locally.
             as_zarr:
                 Whether to save the data as zarr files
+            cache_raw_entries:
+                Whether to keep the collated raw entries on disk, so that preprocessing again
+                does not parse the raw files as long as they and the target names are unchanged.
+                Changes to read_raw_entries are not detected, the cache in <root>/raw_entries/<name>
+                has to be removed after editing it.
         """
         if overwrite or not self.is_preprocessed():
-            entries = self.read_raw_entries()
-            res = self.collate_list(entries)
+            if cache_raw_entries:
+                res = cached_raw_entries(
+                    self.raw_entries_path,
+                    self._read_and_collate,
+                    self.raw_files,
+                    (self.energy_target_names, self.force_target_names),
+                )
+            else:
+                res = self._read_and_collate()
             self.save_preprocess(res, upload, overwrite, as_zarr)
 
+    def _read_and_collate(self) -> Dict[str, np.ndarray]:
+        return self.collate_list(self.read_raw_entries())
+
+    @property
+    def raw_entries_path(self):
+        # several datasets can share the same root, e.g. QM7 and QM9
+        return p_join(self.root, "raw_entries", self.__name__)
+
+    def raw_files(self) -> List[str]:
+        """
+        List the raw files of the dataset, i.e. the files downloaded from its links. Datasets without
+        links, or whose links are not found in their root folder, fall back to all the files of the root
+        folder except for the ones written by openqdc itself.
+        """
+        downloaded = [p_join(self.root, f) for f in self.__links__]
+        if downloaded and all(os.path.exists(f) for f in downloaded):
+            return downloaded
+        skip = {
+            self.preprocess_path,
+            p_join(self.root, "preprocessed"),
+            p_join(self.root, "raw_entries"),
+            p_join(self.root, "statistics"),
+        }
+        files = []
+        for root, dirs, filenames in os.walk(self.root):
+            dirs[:] = [d for d in dirs if p_join(root, d) not in skip]
+            files.extend(p_join(root, f) for f in filenames)
+        return files
+
     def upload(self, overwrite: bool = False, as_zarr: bool = False):
         """
         Upload the preprocessed data to the remote storage. Must be called after preprocess and
@@ -1,17 +1,102 @@
-from .base import BaseInteractionDataset
-from .des import DES5M, DES370K, DESS66, DESS66x8
-from .l7 import L7
-from .metcalf import Metcalf
-from .splinter import Splinter
-from .x40 import X40
-
-AVAILABLE_INTERACTION_DATASETS = {
-    "DES5M": DES5M,
-    "DES370K": DES370K,
-    "DESS66": DESS66,
-    "DESS66x8": DESS66x8,
-    "L7": L7,
-    "Metcalf": Metcalf,
-    "Splinter": Splinter,
-    "X40": X40,
+import importlib
+import os
+import sys
+import threading
+from types import MappingProxyType
+
+# read once at import time, everything is imported right away when lazy loading is disabled
+_EAGER = os.environ.get("OPENQDC_DISABLE_LAZY_LOADING") == "1"
+
+# The below lazy import logic is derived from the one of the top-level openqdc package
+
+# Dictionary of objects to lazily import; maps the object's name to its module path,
+# the modules are written relative to this package
+_registry = {
+    name: f"{__name__}.{module}"
+    for name, module in {
+        "BaseInteractionDataset": "base",
+        "DES5M": "des",
+        "DES370K": "des",
+        "DESS66": "des",
+        "DESS66x8": "des",
+        "L7": "l7",
+        "Metcalf": "metcalf",
+        "Splinter": "splinter",
+        "X40": "x40",
+    }.items()
 }
+
+# read-only view of the registry, also merged by openqdc.datasets
+_lazy_imports_obj = MappingProxyType(_registry)
+
+# names exported by the package, derived from the registry
+__all__ = [*_registry, "AVAILABLE_INTERACTION_DATASETS"]
+
+# bound once so that __getattr__ does not look up the dict and its method on every call,
+# taken from the dict itself since a lookup through the proxy adds an indirection
+_obj_get = _registry.get
+
+# message of the AttributeError raised for unknown names, only the name is formatted per miss
+_no_attribute = f"module {__name__!r} has no attribute %r"
+
+# the module dict, bound once instead of calling globals() in __getattr__ and __dir__
+_MOD_DICT = globals()
+
+# Datasets exposed through AVAILABLE_INTERACTION_DATASETS, every registered one but the helper classes,
+# only imported on first access
+_not_available = {"BaseInteractionDataset"}
+_available_datasets = [name for name in _registry if name not in _not_available]
+
+
+def __getattr__(name):
+    """Lazily import objects from _lazy_imports_obj
+
+    Note that this method is only called by Python if the name cannot be found
+    in the current module."""
+    if name[:2] == "__" == name[-2:]:
+        # dunder probes from import machinery and tools never name a dataset
+        raise AttributeError(name)
+
+    obj_mod = _obj_get(name)
+    if obj_mod is not None:
+        obj = getattr(sys.modules.get(obj_mod), name, None)
+        if obj is None:
+            # also waits for a module that another thread is still importing
+            obj = getattr(importlib.import_module(obj_mod), name)
+        # later accesses find the object in the module dict and skip __getattr__
+        _MOD_DICT[name] = obj
+        return obj
+
+    if name == "AVAILABLE_INTERACTION_DATASETS":
+        _MOD_DICT[name] = {k: __getattr__(k) for k in _available_datasets}
+        return _MOD_DICT[name]
+
+    raise AttributeError(_no_attribute % name)
+
+
+def __dir__():
+    """Add __all__ to dir(<module>)"""
+    # not cached as the import system keeps adding submodules such as des or base to the module dict;
+    # a set since the lazy names cached in the module dict would otherwise be listed twice
+    return sorted({*_MOD_DICT.keys(), *__all__})
+
+
+def _prewarm():
+    """Import the interaction dataset modules so that a later first access finds them in sys.modules"""
+    for module in dict.fromkeys(_registry.values()):
+        try:
+            importlib.import_module(module)
+        except Exception:
+            # the error is raised again to the caller on first access
+            pass
+
+
+if os.environ.get("OPENQDC_PREWARM_INTERACTION") == "1":
+    threading.Thread(target=_prewarm, name="openqdc-prewarm-interaction", daemon=True).start()
+
+
+if _EAGER:
+    # Import everything right away, type checkers read the names from __init__.pyi
+    for _name in __all__:
+        __getattr__(_name)
+    del _name
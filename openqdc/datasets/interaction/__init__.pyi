@@ -0,0 +1,24 @@
+from typing import Dict, Mapping, Type
+
+from .base import BaseInteractionDataset
+from .des import DES5M, DES370K, DESS66, DESS66x8
+from .l7 import L7
+from .metcalf import Metcalf
+from .splinter import Splinter
+from .x40 import X40
+
+AVAILABLE_INTERACTION_DATASETS: Dict[str, Type[BaseInteractionDataset]]
+_lazy_imports_obj: Mapping[str, str]
+
+__all__ = [
+    "BaseInteractionDataset",
+    "DES5M",
+    "DES370K",
+    "DESS66",
+    "DESS66x8",
+    "L7",
+    "Metcalf",
+    "Splinter",
+    "X40",
+    "AVAILABLE_INTERACTION_DATASETS",
+]
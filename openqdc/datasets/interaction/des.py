@@ -5,11 +5,11 @@ from typing import Dict, List
 import numpy as np
 import pandas as pd
 from loguru import logger
-from tqdm import tqdm
 
 from openqdc.datasets.interaction.base import BaseInteractionDataset
 from openqdc.methods import InteractionMethod, InterEnergyType
 from openqdc.utils.constants import ATOM_TABLE
+from openqdc.utils.io import progress_bar
 from openqdc.utils.molecule import molecule_groups
 
 
@@ -169,7 +169,7 @@ class DES370K(BaseInteractionDataset, IDES):
         logger.info(f"Reading {self.__name__} interaction data from {filepath}")
         df = pd.read_csv(filepath)
         data = []
-        for idx, row in tqdm(df.iterrows(), total=df.shape[0]):
+        for idx, row in progress_bar(df.iterrows(), total=df.shape[0]):
             item = parse_des_df(row, self.energy_target_names)
             item["subset"] = self._create_subsets(row=row, **item)
             item = convert_to_record(item)
@@ -1,17 +1,19 @@
+import mmap
 import os
 from glob import glob
-from io import StringIO
+from io import BytesIO
 from os.path import join as p_join
 from typing import Dict, List
 
+import datamol as dm
 import numpy as np
 from loguru import logger
-from tqdm import tqdm
 
 from openqdc.datasets.interaction.base import BaseInteractionDataset
 from openqdc.methods import InteractionMethod, InterEnergyType
-from openqdc.utils.constants import ATOM_TABLE
 from openqdc.utils.download_api import decompress_tar_gz
+from openqdc.utils.io import progress_bar
+from openqdc.utils.molecule import pack_atomic_inputs, symbols_to_atomic_numbers
 
 EXPECTED_TAR_FILES = {
     "train": [
@@ -36,50 +38,75 @@ EXPECTED_TAR_FILES = {
 }
 
 
+def extract_tar_gz(tar_file_path):
+    try:
+        decompress_tar_gz(tar_file_path)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"File {tar_file_path} not found") from e
+
+
 def extract_raw_tar_gz(folder):
     logger.info(f"Extracting all tar.gz files in {folder}")
-    for subset in EXPECTED_TAR_FILES:
-        for tar_file in EXPECTED_TAR_FILES[subset]:
-            tar_file_path = p_join(folder, tar_file)
-            try:
-                decompress_tar_gz(tar_file_path)
-            except FileNotFoundError as e:
-                raise FileNotFoundError(f"File {tar_file_path} not found") from e
+    tar_files = [p_join(folder, tar_file) for subset in EXPECTED_TAR_FILES for tar_file in EXPECTED_TAR_FILES[subset]]
+    dm.parallelized(extract_tar_gz, tar_files, scheduler="threads", n_jobs=-1)
 
 
-def content_to_xyz(content, subset):
+def content_to_xyz(content):
+    """
+    Split an xyz frame given as bytes into its number of atoms, name, energies and raw coordinate block.
+    Only the header is decoded. Returns None if the header of the frame cannot be parsed.
+    """
     try:
-        num_atoms = np.array([int(content.split("\n")[0])])
-        tmp = content.split("\n")[1].split(",")
+        first, second, rest = content.split(b"\n", 2)
+        num_atoms = int(first)
+        tmp = second.decode().split(",")
         name = tmp[0]
         e = np.array(list(map(float, tmp[1:-1]))).astype(np.float32)
     except Exception as e:
         logger.warning(f"Encountered exception in {content} : {e}")
         return None
 
-    s = StringIO(content)
-    d = np.loadtxt(s, skiprows=2, dtype="str")
-    z, positions = d[:, 0], d[:, 1:].astype(np.float32)
-    z = np.array([ATOM_TABLE.GetAtomicNumber(s) for s in z])
-    xs = np.stack((z, np.zeros_like(z)), axis=-1)
-
-    item = dict(
-        n_atoms=num_atoms,
-        subset=np.array([subset]),
-        energies=e,
-        atomic_inputs=np.concatenate((xs, positions), axis=-1, dtype=np.float32),
-        name=np.array([name]),
-        n_atoms_ptr=np.array([-1]),
-    )
+    return num_atoms, name, e, rest
+
 
-    return item
+def iter_frames(buffer):
+    """Yield the frames of an xyz buffer, separated by blank lines"""
+    start = 0
+    while start < len(buffer):
+        end = buffer.find(b"\n\n", start)
+        if end == -1:
+            end = len(buffer)
+        yield buffer[start:end]
+        start = end + 2
 
 
 def read_xyz(fname, subset):
-    with open(fname, "r") as f:
-        contents = f.read().split("\n\n")
-    res = [content_to_xyz(content, subset) for content in tqdm(contents)]
-    return res
+    if os.path.getsize(fname) == 0:
+        return None
+    # the file is mapped rather than read into a str, frames are sliced from it as bytes
+    with open(fname, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        frames = [frame for frame in map(content_to_xyz, iter_frames(mm)) if frame is not None]
+    if len(frames) == 0:
+        return None
+    num_atoms, names, energies, blocks = zip(*frames)
+    n_atoms = np.array(num_atoms, dtype=np.int32)
+
+    # parse the coordinates of all the frames at once instead of frame by frame
+    d = np.loadtxt(BytesIO(b"\n".join(blocks)), dtype=[("z", "U3"), ("xyz", np.float32, (3,))])
+    if d.shape[0] != n_atoms.sum():
+        raise ValueError(f"Number of atoms in {fname} does not match the xyz headers")
+
+    z = symbols_to_atomic_numbers(d["z"])
+    n = len(n_atoms)
+
+    return dict(
+        n_atoms=n_atoms,
+        subset=np.broadcast_to(np.array([subset]), n),
+        energies=np.stack(energies, axis=0),
+        atomic_inputs=pack_atomic_inputs(z, d["xyz"]),
+        name=np.array(names),
+        n_atoms_ptr=np.full(n, -1, dtype=np.int32),
+    )
 
 
 class Metcalf(BaseInteractionDataset):
@@ -130,6 +157,9 @@ class Metcalf(BaseInteractionDataset):
         # extract in folders
         extract_raw_tar_gz(self.root)
         data = []
-        for filename in glob(self.root + f"{os.sep}*.xyz"):
-            data.extend(read_xyz(filename, self.__name__))
+        for filename in progress_bar(glob(self.root + f"{os.sep}*.xyz")):
+            res = read_xyz(filename, self.__name__)
+            # empty or unparseable files are skipped
+            if res is not None:
+                data.append(res)
         return data
@@ -3,11 +3,11 @@ from typing import Dict, List
 
 import numpy as np
 from loguru import logger
-from tqdm import tqdm
 
 from openqdc.datasets.interaction.base import BaseInteractionDataset
 from openqdc.methods import InteractionMethod, InterEnergyType
-from openqdc.utils.constants import ATOM_TABLE
+from openqdc.utils.io import progress_bar
+from openqdc.utils.molecule import symbols_to_atomic_numbers
 
 
 class Splinter(BaseInteractionDataset):
@@ -120,17 +120,17 @@ class Splinter(BaseInteractionDataset):
         logger.info(f"Reading Splinter interaction data from {self.root}")
         data = []
         i = 0
-        with tqdm(total=1680022) as progress_bar:
+        with progress_bar(total=1680022) as pbar:
             for root, dirs, files in os.walk(self.root):  # total is currently an approximation
                 for filename in files:
                     if not filename.endswith(".xyz"):
                         continue
                     i += 1
                     filepath = os.path.join(root, filename)
-                    filein = open(filepath, "r")
-                    lines = list(map(lambda x: x.strip(), filein.readlines()))
-                    n_atoms = np.array([int(lines[0])], dtype=np.int32)
-                    metadata = lines[1].split(",")
+                    with open(filepath, "r") as filein:
+                        n_atoms = np.array([int(filein.readline())], dtype=np.int32)
+                        metadata = filein.readline().strip().split(",")
+                        d = np.loadtxt(filein, dtype=[("z", "U3"), ("xyz", np.float32, (3,))], ndmin=1)
                     try:
                         (
                             protein_monomer_name,
@@ -161,10 +161,8 @@ class Splinter(BaseInteractionDataset):
                     energies = np.array([list(map(float, metadata[4:-1]))]).astype(np.float32)
                     n_atoms_ptr = np.array([int(metadata[-1])], dtype=np.int32)
                     total_charge, charge0, charge1 = list(map(int, metadata[1:4]))
-                    lines = list(map(lambda x: x.split(), lines[2:]))
-                    pos = np.array(lines)[:, 1:].astype(np.float32)
-                    elems = np.array(lines)[:, 0]
-                    atomic_nums = np.expand_dims(np.array([ATOM_TABLE.GetAtomicNumber(x) for x in elems]), axis=1)
+                    pos = d["xyz"]
+                    atomic_nums = np.expand_dims(symbols_to_atomic_numbers(d["z"]), axis=1)
                     natoms0 = n_atoms_ptr[0]
                     natoms1 = n_atoms[0] - natoms0
                     charges = np.expand_dims(np.array([charge0] * natoms0 + [charge1] * natoms1), axis=1)
@@ -191,6 +189,6 @@ class Splinter(BaseInteractionDataset):
                         name=np.array([protein_monomer_name + "." + ligand_monomer_name]),
                     )
                     data.append(item)
-                    progress_bar.update(1)
+                    pbar.update(1)
         logger.info(f"Processed {i} files in total")
         return data
@@ -1,75 +1,123 @@
-from .alchemy import Alchemy
-from .ani import ANI1, ANI1CCX, ANI1CCX_V2, ANI1X, ANI2X
-from .bpa import BPA
-from .comp6 import COMP6
-from .dummy import Dummy, PredefinedDataset
-from .gdml import GDML
-from .geom import GEOM
-from .iso_17 import ISO17
-from .maceoff import MACEOFF
-from .md22 import MD22
-from .molecule3d import Molecule3D
-from .multixcqm9 import MultixcQM9, MultixcQM9_V2
-from .nabladft import NablaDFT
-from .orbnet_denali import OrbnetDenali
-from .pcqm import PCQM_B3LYP, PCQM_PM6
-from .proteinfragments import MDDataset, ProteinFragments
-from .qm1b import QM1B, QM1B_SMALL
-from .qm7x import QM7X, QM7X_V2
-from .qmugs import QMugs, QMugs_V2
-from .qmx import QM7, QM8, QM9, QM7b
-from .revmd17 import RevMD17
-from .sn2_rxn import SN2RXN
-from .solvated_peptides import SolvatedPeptides
-from .spice import Spice, SpiceV2, SpiceVL2
-from .tmqm import TMQM
-from .transition1x import Transition1X
-from .vqm24 import VQM24
-from .waterclusters import SCANWaterClusters
-from .waterclusters3_30 import WaterClusters
-
-AVAILABLE_POTENTIAL_DATASETS = {
-    "Alchemy": Alchemy,
-    "ANI1": ANI1,
-    "ANI1CCX": ANI1CCX,
-    "ANI1CCX_V2": ANI1CCX_V2,
-    "ANI1X": ANI1X,
-    "ANI2X": ANI2X,
-    "BPA": BPA,
-    "COMP6": COMP6,
-    "GDML": GDML,
-    "GEOM": GEOM,
-    "ISO17": ISO17,
-    "Molecule3D": Molecule3D,
-    "MACEOFF": MACEOFF,
-    "NablaDFT": NablaDFT,
-    "OrbnetDenali": OrbnetDenali,
-    "PCQM_B3LYP": PCQM_B3LYP,
-    "PCQM_PM6": PCQM_PM6,
-    "QM7X": QM7X,
-    "QM7X_V2": QM7X_V2,
-    "QMugs": QMugs,
-    "QMugs_V2": QMugs_V2,
-    "QM1B": QM1B,
-    "QM1B_SMALL": QM1B_SMALL,
-    "QM7": QM7,
-    "QM7b": QM7b,
-    "QM8": QM8,
-    "QM9": QM9,
-    "SN2RXN": SN2RXN,
-    "SolvatedPeptides": SolvatedPeptides,
-    "Spice": Spice,
-    "SpiceV2": SpiceV2,
-    "SpiceVL2": SpiceVL2,
-    "TMQM": TMQM,
-    "Transition1X": Transition1X,
-    "WaterClusters": WaterClusters,
-    "SCANWaterClusters": SCANWaterClusters,
-    "MultixcQM9": MultixcQM9,
-    "MultixcQM9_V2": MultixcQM9_V2,
-    "RevMD17": RevMD17,
-    "MD22": MD22,
-    "VQM24": VQM24,
-    "ProteinFragments": ProteinFragments,
-    "MDDataset": MDDataset,
+import importlib
+import os
+import sys
+from types import MappingProxyType
+
+# read once at import time, everything is imported right away when lazy loading is disabled
+_EAGER = os.environ.get("OPENQDC_DISABLE_LAZY_LOADING") == "1"
+
+# The below lazy import logic is derived from the one of the top-level openqdc package
+
+# Dictionary of objects to lazily import; maps the object's name to its module path,
+# the modules are written relative to this package
+_registry = {
+    name: f"{__name__}.{module}"
+    for name, module in {
+        "Alchemy": "alchemy",
+        "ANI1": "ani",
+        "ANI1CCX": "ani",
+        "ANI1CCX_V2": "ani",
+        "ANI1X": "ani",
+        "ANI2X": "ani",
+        "BPA": "bpa",
+        "COMP6": "comp6",
+        "Dummy": "dummy",
+        "PredefinedDataset": "dummy",
+        "GDML": "gdml",
+        "GEOM": "geom",
+        "ISO17": "iso_17",
+        "MACEOFF": "maceoff",
+        "MD22": "md22",
+        "Molecule3D": "molecule3d",
+        "MultixcQM9": "multixcqm9",
+        "MultixcQM9_V2": "multixcqm9",
+        "NablaDFT": "nabladft",
+        "OrbnetDenali": "orbnet_denali",
+        "PCQM_B3LYP": "pcqm",
+        "PCQM_PM6": "pcqm",
+        "MDDataset": "proteinfragments",
+        "ProteinFragments": "proteinfragments",
+        "QM1B": "qm1b",
+        "QM1B_SMALL": "qm1b",
+        "QM7X": "qm7x",
+        "QM7X_V2": "qm7x",
+        "QMugs": "qmugs",
+        "QMugs_V2": "qmugs",
+        "QM7": "qmx",
+        "QM8": "qmx",
+        "QM9": "qmx",
+        "QM7b": "qmx",
+        "RevMD17": "revmd17",
+        "SN2RXN": "sn2_rxn",
+        "SolvatedPeptides": "solvated_peptides",
+        "Spice": "spice",
+        "SpiceV2": "spice",
+        "SpiceVL2": "spice",
+        "TMQM": "tmqm",
+        "Transition1X": "transition1x",
+        "VQM24": "vqm24",
+        "SCANWaterClusters": "waterclusters",
+        "WaterClusters": "waterclusters3_30",
+    }.items()
 }
+
+# read-only view of the registry, also merged by openqdc.datasets
+_lazy_imports_obj = MappingProxyType(_registry)
+
+# names exported by the package, derived from the registry
+__all__ = [*_registry, "AVAILABLE_POTENTIAL_DATASETS"]
+
+# bound once so that __getattr__ does not look up the dict and its method on every call,
+# taken from the dict itself since a lookup through the proxy adds an indirection
+_obj_get = _registry.get
+
+# message of the AttributeError raised for unknown names, only the name is formatted per miss
+_no_attribute = f"module {__name__!r} has no attribute %r"
+
+# the module dict, bound once instead of calling globals() in __getattr__ and __dir__
+_MOD_DICT = globals()
+
+# Datasets exposed through AVAILABLE_POTENTIAL_DATASETS, every registered one but the helper classes,
+# only imported on first access
+_not_available = {"Dummy", "PredefinedDataset"}
+_available_datasets = [name for name in _registry if name not in _not_available]
+
+
+def __getattr__(name):
+    """Lazily import objects from _lazy_imports_obj
+
+    Note that this method is only called by Python if the name cannot be found
+    in the current module."""
+    if name[:2] == "__" == name[-2:]:
+        # dunder probes from import machinery and tools never name a dataset
+        raise AttributeError(name)
+
+    obj_mod = _obj_get(name)
+    if obj_mod is not None:
+        obj = getattr(sys.modules.get(obj_mod), name, None)
+        if obj is None:
+            # also waits for a module that another thread is still importing
+            obj = getattr(importlib.import_module(obj_mod), name)
+        # later accesses find the object in the module dict and skip __getattr__
+        _MOD_DICT[name] = obj
+        return obj
+
+    if name == "AVAILABLE_POTENTIAL_DATASETS":
+        _MOD_DICT[name] = {k: __getattr__(k) for k in _available_datasets}
+        return _MOD_DICT[name]
+
+    raise AttributeError(_no_attribute % name)
+
+
+def __dir__():
+    """Add __all__ to dir(<module>)"""
+    # not cached as the import system keeps adding submodules such as des or base to the module dict;
+    # a set since the lazy names cached in the module dict would otherwise be listed twice
+    return sorted({*_MOD_DICT.keys(), *__all__})
+
+
+if _EAGER:
+    # Import everything right away, type checkers read the names from __init__.pyi
+    for _name in __all__:
+        __getattr__(_name)
+    del _name
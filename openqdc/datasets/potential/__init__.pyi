@@ -0,0 +1,84 @@
+from typing import Dict, Mapping, Type
+
+from ..base import BaseDataset
+from .alchemy import Alchemy
+from .ani import ANI1, ANI1CCX, ANI1CCX_V2, ANI1X, ANI2X
+from .bpa import BPA
+from .comp6 import COMP6
+from .dummy import Dummy, PredefinedDataset
+from .gdml import GDML
+from .geom import GEOM
+from .iso_17 import ISO17
+from .maceoff import MACEOFF
+from .md22 import MD22
+from .molecule3d import Molecule3D
+from .multixcqm9 import MultixcQM9, MultixcQM9_V2
+from .nabladft import NablaDFT
+from .orbnet_denali import OrbnetDenali
+from .pcqm import PCQM_B3LYP, PCQM_PM6
+from .proteinfragments import MDDataset, ProteinFragments
+from .qm1b import QM1B, QM1B_SMALL
+from .qm7x import QM7X, QM7X_V2
+from .qmugs import QMugs, QMugs_V2
+from .qmx import QM7, QM8, QM9, QM7b
+from .revmd17 import RevMD17
+from .sn2_rxn import SN2RXN
+from .solvated_peptides import SolvatedPeptides
+from .spice import Spice, SpiceV2, SpiceVL2
+from .tmqm import TMQM
+from .transition1x import Transition1X
+from .vqm24 import VQM24
+from .waterclusters import SCANWaterClusters
+from .waterclusters3_30 import WaterClusters
+
+AVAILABLE_POTENTIAL_DATASETS: Dict[str, Type[BaseDataset]]
+_lazy_imports_obj: Mapping[str, str]
+
+__all__ = [
+    "Alchemy",
+    "ANI1",
+    "ANI1CCX",
+    "ANI1CCX_V2",
+    "ANI1X",
+    "ANI2X",
+    "BPA",
+    "COMP6",
+    "Dummy",
+    "PredefinedDataset",
+    "GDML",
+    "GEOM",
+    "ISO17",
+    "MACEOFF",
+    "MD22",
+    "Molecule3D",
+    "MultixcQM9",
+    "MultixcQM9_V2",
+    "NablaDFT",
+    "OrbnetDenali",
+    "PCQM_B3LYP",
+    "PCQM_PM6",
+    "MDDataset",
+    "ProteinFragments",
+    "QM1B",
+    "QM1B_SMALL",
+    "QM7X",
+    "QM7X_V2",
+    "QMugs",
+    "QMugs_V2",
+    "QM7",
+    "QM8",
+    "QM9",
+    "QM7b",
+    "RevMD17",
+    "SN2RXN",
+    "SolvatedPeptides",
+    "Spice",
+    "SpiceV2",
+    "SpiceVL2",
+    "TMQM",
+    "Transition1X",
+    "VQM24",
+    "SCANWaterClusters",
+    "WaterClusters",
+    "AVAILABLE_POTENTIAL_DATASETS",
+]
@@ -3,10 +3,10 @@ from os.path import join as p_join
 import datamol as dm
 import numpy as np
 import pandas as pd
-from tqdm import tqdm
 
 from openqdc.datasets.base import BaseDataset
 from openqdc.methods import PotentialMethod
+from openqdc.utils.io import progress_bar
 from openqdc.utils.molecule import get_atomic_number_and_charge
 
 # ['gdb_idx', 'atom number', 'zpve\n(Ha, zero point vibrational energy)',
@@ -88,7 +88,7 @@ class Alchemy(BaseDataset):
         gdb_idx = full_csv["gdb_idx"]
         idxs = full_csv.index.tolist()
         samples = []
-        for i in tqdm(idxs):
+        for i in progress_bar(idxs):
             sdf_file = p_join(dir_path, f"atom_{atom_folder[i]}", f"{gdb_idx[i]}.sdf")
             energy = energies[i]
             samples.append(read_mol(sdf_file, energy))
@@ -7,6 +7,7 @@ from openqdc.datasets.base import BaseDataset
 from openqdc.methods import PotentialMethod
 from openqdc.utils import load_hdf5_file, read_qc_archive_h5
 from openqdc.utils.io import get_local_cache
+from openqdc.utils.molecule import pack_atomic_inputs
 
 
 def read_ani2_h5(raw_path):
@@ -25,12 +26,11 @@ def extract_ani2_entries(properties):
     n_atoms = coordinates.shape[1]
     n_entries = coordinates.shape[0]
     flattened_coordinates = coordinates[:].reshape((-1, 3))
-    xs = np.stack((species[:].flatten(), np.zeros(flattened_coordinates.shape[0])), axis=-1)
     res = dict(
         name=np.array(["ANI2"] * n_entries),
         subset=np.array([str(n_atoms)] * n_entries),
         energies=energies[:].reshape((-1, 1)).astype(np.float64),
-        atomic_inputs=np.concatenate((xs, flattened_coordinates), axis=-1, dtype=np.float32),
+        atomic_inputs=pack_atomic_inputs(species[:], flattened_coordinates),
         n_atoms=np.array([n_atoms] * n_entries, dtype=np.int32),
         forces=forces[:].reshape(-1, 3, 1).astype(np.float32),
     )
@@ -6,10 +6,10 @@ import datamol as dm
 import numpy as np
 import pandas as pd
 from rdkit import Chem
-from tqdm import tqdm
 
 from openqdc.datasets.base import BaseDataset
 from openqdc.methods import PotentialMethod
+from openqdc.utils.io import progress_bar
 from openqdc.utils.molecule import get_atomic_number_and_charge
 
 
@@ -60,7 +60,7 @@ def _read_sdf(sdf_path: str, properties_path: str) -> List[Dict[str, np.ndarray]
     fn = lambda x: read_mol(x, get_e(x))
 
     suppl = Chem.SDMolSupplier(sdf_path, removeHs=False, sanitize=True)
-    tmp = [fn(suppl[j]) for j in tqdm(range(len(suppl)))]
+    tmp = [fn(suppl[j]) for j in progress_bar(range(len(suppl)))]
 
     return tmp
 
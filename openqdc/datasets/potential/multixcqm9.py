@@ -9,6 +9,7 @@ import pandas as pd
 from openqdc.datasets.base import BaseDataset
 from openqdc.methods import PotentialMethod
 from openqdc.utils.constants import ATOM_TABLE
+from openqdc.utils.molecule import pack_atomic_inputs
 
 
 def read_xyz_and_get_content(fname):
@@ -18,9 +19,8 @@ def read_xyz_and_get_content(fname):
     d = np.loadtxt(s, skiprows=2, dtype="str")
     z, positions = d[:, 0], d[:, 1:].astype(np.float32)
     z = np.array([ATOM_TABLE.GetAtomicNumber(s) for s in z])
-    xs = np.stack((z, np.zeros_like(z)), axis=-1)
     conf = dict(
-        atomic_inputs=np.concatenate((xs, positions), axis=-1, dtype=np.float32),
+        atomic_inputs=pack_atomic_inputs(z, positions),
         name=np.array([basename(fname)]),
         n_atoms=np.array([positions.shape[0]], dtype=np.int32),
         subset=np.array(["multixcqm9"]),
@@ -8,6 +8,7 @@ import pandas as pd
 from openqdc.datasets.base import BaseDataset
 from openqdc.methods import PotentialMethod
 from openqdc.utils.constants import ATOM_TABLE
+from openqdc.utils.molecule import pack_atomic_inputs
 
 
 def read_archive(mol_id, conf_dict, base_path, energy_target_names: List[str]) -> Dict[str, np.ndarray]:
@@ -18,10 +19,9 @@ def read_archive(mol_id, conf_dict, base_path, energy_target_names: List[str]) -
             d = np.loadtxt(cf_name, skiprows=2, dtype="str")
             z, positions = d[:, 0], d[:, 1:].astype(np.float32)
             z = np.array([ATOM_TABLE.GetAtomicNumber(s) for s in z])
-            xs = np.stack((z, np.zeros_like(z)), axis=-1)
 
             conf = dict(
-                atomic_inputs=np.concatenate((xs, positions), axis=-1, dtype=np.float32),
+                atomic_inputs=pack_atomic_inputs(z, positions),
                 name=np.array([mol_id]),
                 energies=np.array([conf_label[k] for k in energy_target_names], dtype=np.float64)[None, :],
                 n_atoms=np.array([positions.shape[0]], dtype=np.int32),
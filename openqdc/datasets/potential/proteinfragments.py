@@ -2,11 +2,11 @@ import os
 from os.path import join as p_join
 
 import numpy as np
-from tqdm import tqdm
 
 from openqdc.datasets.base import BaseDataset
 from openqdc.methods import PotentialMethod
-from openqdc.utils.io import get_local_cache
+from openqdc.utils.io import get_local_cache, progress_bar
+from openqdc.utils.molecule import pack_atomic_inputs
 from openqdc.utils.package_utils import requires_package
 
 
@@ -17,12 +17,11 @@ def convert_entries(r, e, f, z, subset):
     energies = e
     n_atoms = coordinates.shape[0]
     flattened_coordinates = coordinates[:].reshape((-1, 3))
-    xs = np.stack((species[:].flatten(), np.zeros(flattened_coordinates.shape[0])), axis=-1)
     res = dict(
         name=np.array([subset]),
         subset=np.array([subset]),
         energies=energies[:].reshape((-1, 1)).astype(np.float64),
-        atomic_inputs=np.concatenate((xs, flattened_coordinates), axis=-1, dtype=np.float32),
+        atomic_inputs=pack_atomic_inputs(species[:], flattened_coordinates),
         n_atoms=np.array([n_atoms], dtype=np.int32),
         forces=forces[:].reshape(-1, 3, 1).astype(np.float32),
     )
@@ -37,7 +36,7 @@ def read_db(path):
     # entry = 0
     n = len(database)
     entries = []
-    for entry in tqdm(range(n)):
+    for entry in progress_bar(range(n)):
         q, s, z, r, e, f, d = database[entry]
         entries.append(convert_entries(r, e, f, z, subset))
     return entries
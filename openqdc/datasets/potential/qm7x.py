@@ -1,38 +1,49 @@
 from os.path import join as p_join
 
+import datamol as dm
 import numpy as np
-from tqdm import tqdm
 
 from openqdc.datasets.base import BaseDataset
 from openqdc.methods import PotentialMethod
-from openqdc.utils.io import load_hdf5_file
+from openqdc.utils.io import load_hdf5_file, show_progress
 
 
 def read_mol(mol_h5, mol_name, energy_target_names, force_target_names):
     m = mol_h5
     cids = list(mol_h5.keys())
 
-    zs = [m[c]["atNUM"] for c in cids]
-    xyz = np.concatenate([m[c]["atXYZ"] for c in cids], axis=0)
-    n_atoms = np.array([len(z) for z in zs], dtype=np.int32)
-    n, zs = len(n_atoms), np.concatenate(zs, axis=0)
-    a_inputs = np.concatenate([np.stack([zs, np.zeros_like(zs)], axis=-1), xyz], axis=-1)
-
-    forces = np.concatenate([np.stack([m[c][f_tag] for f_tag in force_target_names], axis=-1) for c in cids], axis=0)
-    energies = np.stack([np.array([m[c][e_tag][0] for e_tag in energy_target_names]) for c in cids], axis=0)
+    n_atoms = np.array([m[c]["atNUM"].shape[0] for c in cids], dtype=np.int32)
+    n, offsets = len(n_atoms), np.concatenate(([0], np.cumsum(n_atoms)))
+
+    # fill preallocated buffers conformer by conformer instead of concatenating them
+    a_inputs = np.zeros((offsets[-1], 5), dtype=np.float32)
+    forces = np.empty((offsets[-1], 3, len(force_target_names)), dtype=np.float32)
+    energies = np.empty((n, len(energy_target_names)), dtype=np.float64)
+    for i, c in enumerate(cids):
+        conf, start, end = m[c], offsets[i], offsets[i + 1]
+        a_inputs[start:end, 0] = conf["atNUM"][:]
+        a_inputs[start:end, 2:] = conf["atXYZ"][:]
+        for j, f_tag in enumerate(force_target_names):
+            forces[start:end, :, j] = conf[f_tag][:]
+        energies[i] = [conf[e_tag][0] for e_tag in energy_target_names]
 
     res = dict(
-        name=np.array([mol_name] * n),
-        subset=np.array(["qm7x"] * n),
-        energies=energies.astype(np.float64),
-        atomic_inputs=a_inputs.astype(np.float32),
-        forces=forces.astype(np.float32),
+        name=np.broadcast_to(np.array([mol_name]), n),
+        subset=np.broadcast_to(np.array(["qm7x"]), n),
+        energies=energies,
+        atomic_inputs=a_inputs,
+        forces=forces,
         n_atoms=n_atoms,
     )
 
     return res
 
 
+def read_shard(raw_path, energy_target_names, force_target_names):
+    with load_hdf5_file(raw_path) as data:
+        return [read_mol(data[k], k, energy_target_names, force_target_names) for k in data.keys()]
+
+
 class QM7X(BaseDataset):
     """
     QM7X is a collection of almost 4.2 million conformers from 6,950 unique organic molecules. The molecules with
@@ -72,15 +83,14 @@ class QM7X(BaseDataset):
     __links__ = {f"{i}000.xz": f"https://zenodo.org/record/4288677/files/{i}000.xz" for i in range(1, 9)}
 
     def read_raw_entries(self):
-        samples = []
-        for i in range(1, 9):
-            raw_path = p_join(self.root, f"{i}000")
-            data = load_hdf5_file(raw_path)
-            samples += [
-                read_mol(data[k], k, self.energy_target_names, self.force_target_names) for k in tqdm(data.keys())
-            ]
-
-        return samples
+        # h5py serializes every call behind a global lock, so the shards are read in separate processes
+        inputs = [
+            (p_join(self.root, f"{i}000"), self.energy_target_names, self.force_target_names) for i in range(1, 9)
+        ]
+        list_of_list = dm.parallelized(
+            read_shard, inputs, scheduler="processes", n_jobs=-1, arg_type="args", progress=show_progress()
+        )
+        return [x for xs in list_of_list for x in xs]
 
 
 class QM7X_V2(QM7X):
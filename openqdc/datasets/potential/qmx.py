@@ -10,7 +10,7 @@ from openqdc.datasets.base import BaseDataset
 from openqdc.methods import PotentialMethod
 from openqdc.utils import read_qc_archive_h5
 from openqdc.utils.io import get_local_cache
-from openqdc.utils.molecule import get_atomic_number_and_charge
+from openqdc.utils.molecule import get_atomic_number_and_charge, pack_atomic_inputs
 
 
 def extract_ani2_entries(properties):
@@ -21,12 +21,11 @@ def extract_ani2_entries(properties):
     n_atoms = coordinates.shape[1]
     n_entries = coordinates.shape[0]
     flattened_coordinates = coordinates[:].reshape((-1, 3))
-    xs = np.stack((species[:].flatten(), np.zeros(flattened_coordinates.shape[0])), axis=-1)
     res = dict(
         name=np.array(["ANI2"] * n_entries),
         subset=np.array([str(n_atoms)] * n_entries),
         energies=energies[:].reshape((-1, 1)).astype(np.float64),
-        atomic_inputs=np.concatenate((xs, flattened_coordinates), axis=-1, dtype=np.float32),
+        atomic_inputs=pack_atomic_inputs(species[:], flattened_coordinates),
         n_atoms=np.array([n_atoms] * n_entries, dtype=np.int32),
         forces=forces[:].reshape(-1, 3, 1).astype(np.float32),
     )
@@ -21,29 +21,32 @@ trajectories = {
 
 
 def shape_atom_inputs(coords, atom_species):
-    reshaped_coords = coords.reshape(-1, 3)
     frame, atoms, _ = coords.shape
-    z = np.tile(atom_species, frame)
-    xs = np.stack((z, np.zeros_like(z)), axis=-1)
-    return np.concatenate((xs, reshaped_coords), axis=-1, dtype=np.float32)
+    # broadcast the species over the frames while writing the columns in place
+    res = np.zeros((frame, atoms, 5), dtype=np.float32)
+    res[..., 0] = atom_species
+    res[..., 2:] = coords
+    return res.reshape(-1, 5)
 
 
 def read_npz_entry(filename, root):
-    data = np.load(create_path(filename, root))
-    nuclear_charges, coords, energies, forces = (
-        data["nuclear_charges"],
-        data["coords"],
-        data["energies"],
-        data["forces"],
-    )
+    with np.load(create_path(filename, root)) as data:
+        nuclear_charges, coords, energies, forces = (
+            data["nuclear_charges"],
+            data["coords"],
+            data["energies"],
+            data["forces"],
+        )
     frames = coords.shape[0]
+    # npz members are decompressed on access and cannot be memory-mapped,
+    # so at least avoid copying them again when they already have the right dtype
     res = dict(
-        name=np.array([trajectories[filename]] * frames),
-        subset=np.array([filename] * frames),
-        energies=energies[:, None].astype(np.float64),
-        forces=forces.reshape(-1, 3, 1).astype(np.float32),
+        name=np.broadcast_to(np.array([trajectories[filename]]), frames),
+        subset=np.broadcast_to(np.array([filename]), frames),
+        energies=energies[:, None].astype(np.float64, copy=False),
+        forces=forces.reshape(-1, 3, 1).astype(np.float32, copy=False),
         atomic_inputs=shape_atom_inputs(coords, nuclear_charges),
-        n_atoms=np.array([len(nuclear_charges)] * frames, dtype=np.int32),
+        n_atoms=np.full(frames, len(nuclear_charges), dtype=np.int32),
     )
     return res
 
@@ -1,10 +1,11 @@
 from os.path import join as p_join
 
 import numpy as np
-from tqdm import tqdm
 
 from openqdc.datasets.base import BaseDataset
 from openqdc.methods import PotentialMethod
+from openqdc.utils.io import progress_bar
+from openqdc.utils.molecule import pack_atomic_inputs
 
 
 def extract_npz_entry(data):
@@ -17,7 +18,7 @@ def extract_npz_entry(data):
     energies_full = data["E"]
 
     entries = []
-    for idx in tqdm(range(n_entries)):
+    for idx in progress_bar(range(n_entries)):
         n_atoms = n_atoms_full[idx]
         energies = energies_full[idx]
         nuclear_charges = nuclear_charges_full[idx, :n_atoms][:, None]
@@ -28,9 +29,7 @@ def extract_npz_entry(data):
             subset=np.array(["SN2RXN"]),
             energies=energies.reshape(-1, 1).astype(np.float64),
             forces=forces.reshape(-1, 3, 1).astype(np.float32),
-            atomic_inputs=np.concatenate(
-                (nuclear_charges, np.zeros_like(nuclear_charges), coords), axis=-1, dtype=np.float32
-            ),
+            atomic_inputs=pack_atomic_inputs(nuclear_charges, coords),
             n_atoms=np.array([n_atoms], dtype=np.int32),
         )
         entries.append(res)
@@ -2,11 +2,11 @@ from os.path import join as p_join
 
 import datamol as dm
 import numpy as np
-from tqdm import tqdm
 
 from openqdc.datasets.base import BaseDataset
 from openqdc.methods import PotentialMethod
 from openqdc.utils import load_hdf5_file
+from openqdc.utils.io import progress_bar
 from openqdc.utils.molecule import get_atomic_number_and_charge
 
 
@@ -92,7 +92,7 @@ class Spice(BaseDataset):
         raw_path = p_join(self.root, "SPICE-1.1.4.hdf5")
 
         data = load_hdf5_file(raw_path)
-        tmp = [read_record(data[mol_name], self) for mol_name in tqdm(data)]  # don't use parallelized here
+        tmp = [read_record(data[mol_name], self) for mol_name in progress_bar(data)]  # don't use parallelized here
 
         return tmp
 
@@ -148,7 +148,7 @@ class SpiceV2(Spice):
         data = load_hdf5_file(raw_path)
         # Entry 40132 without positions, skip it
         # don't use parallelized here
-        tmp = [read_record(data[mol_name], self) for i, mol_name in enumerate(tqdm(data)) if i != 40132]
+        tmp = [read_record(data[mol_name], self) for i, mol_name in enumerate(progress_bar(data)) if i != 40132]
 
         return tmp
 
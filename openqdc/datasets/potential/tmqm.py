@@ -3,11 +3,12 @@ from os.path import join as p_join
 
 import numpy as np
 import pandas as pd
-from tqdm import tqdm
 
 from openqdc.datasets.base import BaseDataset
 from openqdc.methods import PotentialMethod
 from openqdc.utils.constants import ATOM_TABLE
+from openqdc.utils.io import progress_bar
+from openqdc.utils.molecule import pack_atomic_inputs
 
 
 def content_to_xyz(content, e_map):
@@ -23,11 +24,10 @@ def content_to_xyz(content, e_map):
     d = np.loadtxt(s, skiprows=2, dtype="str")
     z, positions = d[:, 0], d[:, 1:].astype(np.float32)
     z = np.array([ATOM_TABLE.GetAtomicNumber(s) for s in z])
-    xs = np.stack((z, np.zeros_like(z)), axis=-1)
     e = e_map[code]
 
     conf = dict(
-        atomic_inputs=np.concatenate((xs, positions), axis=-1, dtype=np.float32),
+        atomic_inputs=pack_atomic_inputs(z, positions),
         name=np.array([name]),
         energies=np.array([e], dtype=np.float64)[:, None],
         n_atoms=np.array([positions.shape[0]], dtype=np.int32),
@@ -41,7 +41,7 @@ def read_xyz(fname, e_map):
     with open(fname, "r") as f:
         contents = f.read().split("\n\n")
 
-    res = [content_to_xyz(content, e_map) for content in tqdm(contents)]
+    res = [content_to_xyz(content, e_map) for content in progress_bar(contents)]
     return res
 
 
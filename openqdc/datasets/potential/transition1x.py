@@ -1,12 +1,11 @@
 from os.path import join as p_join
 
 import numpy as np
-from tqdm import tqdm
 
 from openqdc.datasets.base import BaseDataset
 from openqdc.methods import PotentialMethod
 from openqdc.utils.constants import NB_ATOMIC_FEATURES
-from openqdc.utils.io import load_hdf5_file
+from openqdc.utils.io import load_hdf5_file, progress_bar
 
 
 def read_record(r, group):
@@ -79,5 +78,5 @@ class Transition1X(BaseDataset):
         raw_path = p_join(self.root, "Transition1x.h5")
         f = load_hdf5_file(raw_path)["data"]
 
-        res = sum([read_record(f[g], group=g) for g in tqdm(f)], [])  # don't use parallelized here
+        res = sum([read_record(f[g], group=g) for g in progress_bar(f)], [])  # don't use parallelized here
         return res
@@ -5,11 +5,11 @@ import numpy as np
 
 from openqdc.datasets.base import BaseDataset
 from openqdc.methods import PotentialMethod
+from openqdc.utils.molecule import pack_atomic_inputs
 
 
 def shape_atom_inputs(coords, atom_species):
-    xs = np.stack((atom_species, np.zeros_like(atom_species)), axis=-1)
-    return np.concatenate((xs, coords), axis=-1, dtype=np.float32)
+    return pack_atomic_inputs(atom_species, coords)
 
 
 def read_npz_entry(raw_path):
@@ -3,11 +3,12 @@ from io import StringIO
 from os.path import join as p_join
 
 import numpy as np
-from tqdm import tqdm
 
 from openqdc.datasets.base import BaseDataset
 from openqdc.methods import PotentialMethod
 from openqdc.utils.constants import ATOM_TABLE, MAX_ATOMIC_NUMBER
+from openqdc.utils.io import progress_bar
+from openqdc.utils.molecule import pack_atomic_inputs
 
 
 def content_to_xyz(content, n_waters):
@@ -19,7 +20,6 @@ def content_to_xyz(content, n_waters):
         d = np.loadtxt(s, skiprows=2, dtype="str")
         z, positions = d[:, 0], d[:, 1:].astype(np.float32)
         z = np.array([ATOM_TABLE.GetAtomicNumber(s) for s in z])
-        xs = np.stack((z, np.zeros_like(z)), axis=-1)
         e = float(tmp[1].strip().split(" ")[-1])
     except Exception:
         print("Error in reading xyz file")
@@ -27,7 +27,7 @@ def content_to_xyz(content, n_waters):
         return None
 
     conf = dict(
-        atomic_inputs=np.concatenate((xs, positions), axis=-1, dtype=np.float32),
+        atomic_inputs=pack_atomic_inputs(z, positions),
         name=np.array([f"water_{n_waters}"]),
         energies=np.array([e], dtype=np.float64)[:, None],
         n_atoms=np.array([positions.shape[0]], dtype=np.int32),
@@ -43,7 +43,7 @@ def read_xyz(fname, n_waters):
         lines = f.readlines()
         contents = ["".join(lines[i : i + s]) for i in range(0, len(lines), s)]
 
-    res = [content_to_xyz(content, n_waters) for content in tqdm(contents)]
+    res = [content_to_xyz(content, n_waters) for content in progress_bar(contents)]
     return res
 
 
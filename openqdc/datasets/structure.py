@@ -7,7 +7,7 @@ from typing import Callable, Dict, List, Optional, Tuple, Union
 import numpy as np
 import zarr
 
-from openqdc.utils.io import pull_locally
+from openqdc.utils.io import pull_many_locally
 
 
 class GeneralStructure(ABC):
@@ -123,10 +123,14 @@ class GeneralStructure(ABC):
             extra_data_keys:  list of keys to load from the extra data file
             overwrite:        whether to overwrite the local cache
         """
+        filenames = [self.join_and_ext(preprocess_path, key) for key in data_keys]
+        # the extra files are fetched in the same batch as the data files
+        pull_many_locally(
+            filenames + [p_join(preprocess_path, f) for f in self._extra_files or []], overwrite=overwrite
+        )
+
         data = {}
-        for key in data_keys:
-            filename = self.join_and_ext(preprocess_path, key)
-            pull_locally(filename, overwrite=overwrite)
+        for key, filename in zip(data_keys, filenames):
             data[key] = self.load_fn(filename, mode="r", dtype=data_types[key])
             data[key] = self.unpack(data[key])
             data[key] = data[key].reshape(*data_shapes[key])
@@ -187,7 +191,6 @@ class MemMapDataset(GeneralStructure):
 
     def load_extra_files(self, data, preprocess_path, data_keys, pkl_data_keys, overwrite):
         filename = p_join(preprocess_path, "props.pkl")
-        pull_locally(filename, overwrite=overwrite)
         with open(filename, "rb") as f:
             tmp = pkl.load(f)
             all_pkl_keys = set(tmp.keys()) - set(data_keys)
@@ -261,7 +264,6 @@ class ZarrDataset(GeneralStructure):
 
     def load_extra_files(self, data, preprocess_path, data_keys, pkl_data_keys, overwrite):
         filename = self.join_and_ext(preprocess_path, "metadata")
-        pull_locally(filename, overwrite=overwrite)
         tmp = self.load_fn(filename)
         all_pkl_keys = set(tmp.keys()) - set(data_keys)
         # assert required pkl_keys are present in all_pkl_keys
@@ -8,7 +8,7 @@ import urllib.request
 import warnings
 import zipfile
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 
 import fsspec
 import gdown
@@ -115,6 +115,22 @@ class FileSystem:
             ),
         )
 
+    def get_files(self, remote_paths: List[str], local_paths: List[str]):
+        """
+        Retrieve several files from remote gs paths, the transfers are run concurrently
+        """
+        self.public.get(
+            remote_paths,
+            local_paths,
+            callback=TqdmCallback(
+                tqdm_kwargs={
+                    "ascii": " ▖▘▝▗▚▞-",
+                    "desc": f"Downloading {len(remote_paths)} files",
+                    "unit": "file",
+                }
+            ),
+        )
+
     def put_file(self, local_path: str, remote_path: str):
         """
         Attempt to push file to remote gs path
@@ -176,6 +192,15 @@ def decompress_tar_gz(local_filename):
             Path to local file to decompress.
     """
     parent = os.path.dirname(local_filename)
+    # listing the members of a compressed archive requires decompressing it entirely,
+    # so they are saved in a marker file newer than the archive and read from there on later calls
+    marker = local_filename + ".extracted"
+    if os.path.exists(marker) and os.path.getmtime(marker) >= os.path.getmtime(local_filename):
+        with open(marker) as f:
+            all_names = f.read().splitlines()
+        if all([os.path.exists(os.path.join(parent, x)) for x in all_names]):
+            logger.info(f"Archive already extracted: {local_filename}")
+            return
     with tarfile.open(local_filename) as tar:
         logger.info(f"Verifying archive extraction states: {local_filename}")
         all_names = tar.getnames()
@@ -185,6 +210,8 @@ def decompress_tar_gz(local_filename):
             tar.extractall(path=parent)
         else:
             logger.info(f"Archive already extracted: {local_filename}")
+    with open(marker, "w") as f:
+        f.write("\n".join(all_names))
 
 
 def decompress_zip(local_filename):
@@ -1,25 +1,29 @@
 """IO utilities."""
 
+import hashlib
 import json
 import os
 import pickle as pkl
+import shutil
 
 # from os.path import join as p_join
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 import fsspec
 import h5py
 import numpy as np
-import pandas as pd
 from ase.atoms import Atoms
 from ase.calculators.calculator import Calculator
 from loguru import logger
 from rdkit.Chem import MolFromXYZFile
 from tqdm import tqdm
 
-from openqdc.utils.constants import ATOM_TABLE
 from openqdc.utils.download_api import API
-from openqdc.utils.molecule import z_to_formula
+from openqdc.utils.molecule import (
+    pack_atomic_inputs,
+    symbols_to_atomic_numbers,
+    z_to_formula,
+)
 
 _OPENQDC_CACHE_DIR = (
     "~/.cache/openqdc" if "OPENQDC_CACHE_DIR" not in os.environ else os.path.normpath(os.environ["OPENQDC_CACHE_DIR"])
@@ -31,6 +35,24 @@ _OPENQDC_DOWNLOAD_API = {
     "gs": "https://storage.googleapis.com/qmdata-public/openqdc",
 }
 
+# Remote paths already known to exist, to avoid a request per check
+_REMOTE_EXIST_CACHE = set()
+
+
+def show_progress() -> bool:
+    """Whether progress bars are displayed, they can be turned off with OPENQDC_PROGRESS=0"""
+    return os.environ.get("OPENQDC_PROGRESS", "1") != "0"
+
+
+def progress_bar(iterable=None, **kwargs) -> tqdm:
+    """
+    tqdm progress bar for the ingestion loops, refreshed at most twice per second.
+    It is hidden when OPENQDC_PROGRESS=0 or when stderr is not a terminal.
+    """
+    kwargs.setdefault("mininterval", 0.5)
+    kwargs.setdefault("disable", None if show_progress() else True)
+    return tqdm(iterable, **kwargs)
+
 
 def set_cache_dir(d):
     r"""
@@ -96,6 +118,19 @@ def pull_locally(local_path, overwrite=False):
     return local_path
 
 
+def pull_many_locally(local_paths: List[str], overwrite=False):
+    """
+    Retrieve several files from remote gs paths or local cache, downloading the missing ones in a single batch
+    """
+    local_cache, remote_cache = get_local_cache(), get_remote_cache()
+    missing = [path for path in local_paths if overwrite or not os.path.exists(path)]
+    if missing:
+        for path in missing:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        API.get_files([path.replace(local_cache, remote_cache) for path in missing], missing)
+    return local_paths
+
+
 def request_s3fs_config():
     import httpx
 
@@ -106,8 +141,16 @@ def request_s3fs_config():
 
 
 def copy_exists(local_path):
+    if os.path.exists(local_path):
+        return True
     remote_path = local_path.replace(get_local_cache(), get_remote_cache())
-    return os.path.exists(local_path) or API.exists(remote_path)
+    if remote_path in _REMOTE_EXIST_CACHE:
+        return True
+    # only hits are remembered, a missing file can still be uploaded later in the session
+    exists = API.exists(remote_path)
+    if exists:
+        _REMOTE_EXIST_CACHE.add(remote_path)
+    return exists
 
 
 def makedirs_gcs(path, exist_ok=True):
@@ -159,21 +202,14 @@ def load_pkl(path, check=True):
 
 
 def load_hdf5_file(hdf5_file_path: str):
-    """Loads hdf5 file with fsspec"""
+    """Loads local hdf5 file"""
     if not check_file(hdf5_file_path):
         raise FileNotFoundError(f"File {hdf5_file_path} does not exist on GCS and local.")
 
-    fp = fsspec.open(hdf5_file_path, "rb")
-    if hasattr(fp, "open"):
-        fp = fp.open()
-    file = h5py.File(fp)
-
-    # inorder to enable multiprocessing:
-    # https://github.com/fsspec/gcsfs/issues/379#issuecomment-839929801
-    # fsspec.asyn.iothread[0] = None
-    # fsspec.asyn.loop[0] = None
-
-    return file
+    # a larger chunk cache avoids decompressing the same chunk again for every small read that hits it
+    cache_mb = int(os.environ.get("OPENQDC_HDF5_CACHE_MB", "256"))
+    # the file is read by the HDF5 driver directly rather than through a python file object
+    return h5py.File(hdf5_file_path, "r", rdcc_nbytes=cache_mb * 1024 * 1024)
 
 
 def create_hdf5_file(hdf5_file_path: str):
@@ -190,6 +226,58 @@ def load_json(path):
         return json.load(fp)
 
 
+def _raw_entries_key(source_paths: List[str], settings: Tuple) -> str:
+    from openqdc._version import __version__
+
+    stamps = sorted((path, os.path.getmtime(path)) for path in source_paths)
+    return hashlib.sha1(repr((__version__, settings, stamps)).encode()).hexdigest()
+
+
+def cached_raw_entries(
+    cache_dir: str,
+    loader_fn: Callable[[], Dict[str, np.ndarray]],
+    source_fn: Callable[[], List[str]],
+    settings: Tuple = (),
+) -> Dict[str, np.ndarray]:
+    """
+    Returns the collated raw entries produced by loader_fn and caches them on disk.
+    The arrays are stored as one .npy file per key, in a subfolder of cache_dir named after
+    the openqdc version, the settings and the modification times of the source files. As long
+    as none of them change, later calls memory-map the cached arrays instead of parsing
+    the raw data again. Changes to the code of loader_fn are not detected, cache_dir has to
+    be removed after editing it.
+
+    Args:
+        cache_dir (str): folder in which the cached arrays are stored.
+        loader_fn (Callable): function returning the collated raw entries.
+        source_fn (Callable): function listing the paths of the raw files the entries are read from.
+        settings (Tuple): values loader_fn depends on, the cached arrays are only reused for the same ones.
+    """
+    entries_dir = os.path.join(cache_dir, _raw_entries_key(source_fn(), settings))
+    index_path = os.path.join(entries_dir, "keys.json")
+    if os.path.exists(index_path):
+        logger.info(f"Loading cached raw entries from {entries_dir}")
+        return {k: np.load(os.path.join(entries_dir, f"{k}.npy"), mmap_mode="r") for k in load_json(index_path)}
+
+    data = loader_fn()
+    if any(v.dtype == object for v in data.values()):
+        logger.warning("Raw entries containing object arrays cannot be cached without pickling them.")
+        return data
+
+    # reading the entries can extract archives next to the sources, so the key is computed again
+    entries_dir = os.path.join(cache_dir, _raw_entries_key(source_fn(), settings))
+    index_path = os.path.join(entries_dir, "keys.json")
+    # only keep the entries matching the current state of the sources
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    os.makedirs(entries_dir)
+    for k, v in data.items():
+        np.save(os.path.join(entries_dir, f"{k}.npy"), v)
+    # written last so that an interrupted save is never picked up
+    with open(index_path, "w") as f:
+        json.dump(list(data.keys()), f)
+    return data
+
+
 def load_xyz(path):
     """
     Load XYZ file using RDKit
@@ -255,43 +343,52 @@ def print_h5_tree(val, pre=""):
                 print(pre + "├── " + key + " (%d)" % len(val))
 
 
-def extract_entry(
-    df: pd.DataFrame,
-    i: int,
-    subset: str,
-    energy_target_names: List[str],
-    force_target_names: Optional[List[str]] = None,
+def _read_qc_archive_group(
+    group: h5py.Group, subset: str, energy_target_names: List[str], force_target_names: Optional[List[str]]
 ) -> Dict[str, np.ndarray]:
-    x = np.array([ATOM_TABLE.GetAtomicNumber(s) for s in df["symbols"][i]])
-    xs = np.stack((x, np.zeros_like(x)), axis=-1)
-    positions = df["geometry"][i].reshape((-1, 3))
-    energies = np.array([df[k][i] for k in energy_target_names])
+    symbols = group["symbols"][:]
+    n = len(symbols)
+    n_atoms = np.fromiter(map(len, symbols), dtype=np.int32, count=n)
+    offsets = np.concatenate(([0], np.cumsum(n_atoms)))
+
+    x = symbols_to_atomic_numbers(np.concatenate(symbols))
+    positions = np.concatenate(group["geometry"][:], axis=0).reshape((-1, 3))
+    energies = np.concatenate([group[k][:].reshape((n, -1)) for k in energy_target_names], axis=-1)
+
+    if subset is not None:
+        subsets = np.broadcast_to(np.array([subset]), n)
+    else:
+        subsets = np.array([z_to_formula(z) for z in np.split(x, offsets[1:-1])])
 
     res = dict(
-        name=np.array([df["name"][i]]),
-        subset=np.array([subset if subset is not None else z_to_formula(x)]),
-        energies=energies.reshape((1, -1)).astype(np.float64),
-        atomic_inputs=np.concatenate((xs, positions), axis=-1, dtype=np.float32),
-        n_atoms=np.array([x.shape[0]], dtype=np.int32),
+        name=np.array(list(group["name"][:])),
+        subset=subsets,
+        energies=energies.astype(np.float64),
+        atomic_inputs=pack_atomic_inputs(x, positions),
+        n_atoms=n_atoms,
     )
     if force_target_names is not None and len(force_target_names) > 0:
-        forces = np.zeros((positions.shape[0], 3, len(force_target_names)), dtype=np.float32)
-        forces += np.nan
+        forces = np.empty((offsets[-1], 3, len(force_target_names)), dtype=np.float32)
         for j, k in enumerate(force_target_names):
-            if len(df[k][i]) != 0:
-                forces[:, :, j] = df[k][i].reshape((-1, 3))
+            grads = group[k][:]
+            # molecules without gradients are stored as empty arrays and get NaN forces
+            mask = np.fromiter(map(len, grads), dtype=np.int64, count=n) > 0
+            atom_mask = np.repeat(mask, n_atoms)
+            if mask.any():
+                forces[atom_mask, :, j] = np.concatenate(grads[mask], axis=0).reshape((-1, 3))
+            if not mask.all():
+                forces[~atom_mask, :, j] = np.nan
         res["forces"] = forces
-
     return res
 
 
 def read_qc_archive_h5(
     raw_path: str, subset: str, energy_target_names: List[str], force_target_names: Optional[List[str]] = None
 ) -> List[Dict[str, np.ndarray]]:
-    """Extracts data from the HDF5 archive file."""
-    data = load_hdf5_file(raw_path)
-    data_t = {k2: data[k1][k2][:] for k1 in data.keys() for k2 in data[k1].keys()}
-
-    n = len(data_t["molecule_id"])
-    samples = [extract_entry(data_t, i, subset, energy_target_names, force_target_names) for i in tqdm(range(n))]
-    return samples
+    """
+    Extracts data from the HDF5 archive file.
+    Each top-level group gives one entry whose arrays are concatenated along the first axis,
+    only the datasets needed for these arrays are read.
+    """
+    with load_hdf5_file(raw_path) as data:
+        return [_read_qc_archive_group(data[k], subset, energy_target_names, force_target_names) for k in data.keys()]
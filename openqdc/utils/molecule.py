@@ -6,7 +6,7 @@ import numpy as np
 from numpy import ndarray
 from rdkit import Chem
 
-from openqdc.utils.constants import ATOM_SYMBOLS
+from openqdc.utils.constants import ATOM_SYMBOLS, ATOMIC_NUMBERS
 
 # molecule group classification for DES datasets
 molecule_groups = {
@@ -409,6 +409,22 @@ def z_to_formula(z):
     return "".join([f"{ATOM_SYMBOLS[u[i]]}{c[i] if c[i] > 1 else ''}" for i in range(len(u))])
 
 
+def symbols_to_atomic_numbers(symbols) -> ndarray:
+    """Returns atomic numbers for an array of element symbols, only looking up the distinct symbols"""
+    unique, inverse = np.unique(np.asarray(symbols), return_inverse=True)
+    z = np.array([ATOMIC_NUMBERS[s.decode() if isinstance(s, bytes) else s] for s in unique], dtype=np.int32)
+    return z[inverse.reshape(-1)]
+
+
+def pack_atomic_inputs(z: ndarray, xyz: ndarray) -> ndarray:
+    """Returns the (n_atoms, 5) float32 atomic inputs filled with atomic numbers, zero charges and positions"""
+    out = np.empty((len(xyz), 5), dtype=np.float32)
+    out[:, 0] = z.reshape(-1)
+    out[:, 1] = 0.0
+    out[:, 2:] = xyz
+    return out
+
+
 def get_atomic_number(mol: Chem.Mol):
     """Returns atomic numbers for rdkit molecule"""
     return np.array([atom.GetAtomicNum() for atom in mol.GetAtoms()])
@@ -518,3 +518,18 @@ def test_force_conversion(
     np.testing.assert_almost_equal(ds.data["atomic_inputs"][:, 2:], ds_conversion_fn(original_distance))
     np.testing.assert_almost_equal(ds.data["forces"].reshape(1, 192, 3), frcs_conversion_fn(original_forces))
     np.testing.assert_almost_equal(ds[0].e0, en_conversion_fn(original_e0s_first_entry), decimal=4)
+
+
+def test_raw_files(tmp_path):
+    from types import SimpleNamespace
+
+    from openqdc.datasets.base import BaseDataset
+
+    for name in ["data.h5", "statistics/stats.pkl", "raw_entries/ds/entries.pkl", "preprocessed/energies.mmap"]:
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text("")
+    dataset = SimpleNamespace(root=str(tmp_path), preprocess_path=str(tmp_path / "preprocessed"), __links__={})
+    assert BaseDataset.raw_files(dataset) == [str(tmp_path / "data.h5")]
+
+    dataset.__links__ = {"data.h5": "https://example.com/data.h5"}
+    assert BaseDataset.raw_files(dataset) == [str(tmp_path / "data.h5")]
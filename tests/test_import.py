@@ -4,3 +4,86 @@ def test_open_qdc():
 
 def test_dataset():
     from openqdc import Spice  # noqa
+
+
+def test_lazy_dataset_import():
+    import os
+    import subprocess
+    import sys
+
+    code = (
+        "import sys; import openqdc; openqdc.GDML; "
+        "assert 'openqdc.datasets.potential.spice' not in sys.modules; "
+        "assert 'openqdc.datasets.interaction.des' not in sys.modules"
+    )
+    env = {**os.environ, "OPENQDC_DISABLE_LAZY_LOADING": "0"}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+
+def test_available_datasets():
+    from openqdc.datasets import AVAILABLE_DATASETS, AVAILABLE_POTENTIAL_DATASETS
+    from openqdc.datasets.interaction import AVAILABLE_INTERACTION_DATASETS, Metcalf
+
+    assert AVAILABLE_DATASETS == {**AVAILABLE_POTENTIAL_DATASETS, **AVAILABLE_INTERACTION_DATASETS}
+    assert AVAILABLE_INTERACTION_DATASETS["Metcalf"] is Metcalf
+
+
+def test_star_import():
+    namespace = {}
+    exec("from openqdc.datasets import *", namespace)
+    assert "Spice" in namespace and "Metcalf" in namespace and "AVAILABLE_DATASETS" in namespace
+
+
+def test_lazy_attributes_are_cached():
+    import openqdc.datasets.interaction as interaction
+
+    interaction.L7
+    assert "L7" in vars(interaction)
+
+
+def test_lazy_dir():
+    import openqdc.datasets.interaction as interaction
+
+    interaction.X40
+    names = dir(interaction)
+    assert names.count("X40") == 1
+    interaction.AVAILABLE_INTERACTION_DATASETS
+    assert "AVAILABLE_INTERACTION_DATASETS" in dir(interaction)
+    interaction.DES370K
+    assert "des" in dir(interaction)
+
+    import openqdc.datasets as datasets
+
+    datasets.Spice
+    datasets.AVAILABLE_DATASETS
+    names = dir(datasets)
+    assert names.count("Spice") == 1 and names.count("AVAILABLE_DATASETS") == 1
+
+
+def test_lazy_dunder_probe():
+    import openqdc.datasets.interaction as interaction
+
+    assert not hasattr(interaction, "__wrapped__")
+
+
+def test_prewarm_interaction():
+    import os
+    import subprocess
+    import sys
+
+    code = (
+        "import sys; import openqdc.datasets.interaction as m; "
+        "[t.join() for t in __import__('threading').enumerate() if t.name == 'openqdc-prewarm-interaction']; "
+        "assert 'openqdc.datasets.interaction.des' in sys.modules"
+    )
+    env = {**os.environ, "OPENQDC_DISABLE_LAZY_LOADING": "0", "OPENQDC_PREWARM_INTERACTION": "1"}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+
+def test_lazy_missing_attribute():
+    import pytest
+
+    import openqdc.datasets.interaction as interaction
+
+    with pytest.raises(AttributeError, match="has no attribute 'NotADataset'"):
+        interaction.NotADataset
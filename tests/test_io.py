@@ -0,0 +1,205 @@
+import os
+import shutil
+import tarfile
+
+import h5py
+import numpy as np
+import pytest
+
+from openqdc.datasets.interaction.metcalf import read_xyz
+from openqdc.utils.download_api import decompress_tar_gz
+from openqdc.utils.io import cached_raw_entries, read_qc_archive_h5
+from openqdc.utils.molecule import pack_atomic_inputs, symbols_to_atomic_numbers
+
+
+@pytest.fixture
+def metcalf_xyz(tmp_path):
+    xyz_str = """3
+dimer_0,-1.0,-2.0,-3.0,-4.0,-5.0,
+O      0.88581973       0.54890931      -3.39794898
+H      1.09592915      15.43154144       8.50078392
+H     -1.68552792      14.76088047      11.56200695
+
+2
+dimer_1,1.0,2.0,3.0,4.0,5.0,
+C      1.34234893       4.15623617      -3.27245665
+N      0.11595206       5.01309919      -0.78672481
+"""
+    path = tmp_path / "metcalf.xyz"
+    path.write_text(xyz_str)
+    return str(path)
+
+
+def test_metcalf_read_xyz(metcalf_xyz):
+    res = read_xyz(metcalf_xyz, "metcalf")
+    np.testing.assert_array_equal(res["n_atoms"], [3, 2])
+    np.testing.assert_array_equal(res["name"], ["dimer_0", "dimer_1"])
+    np.testing.assert_array_equal(res["subset"], ["metcalf", "metcalf"])
+    np.testing.assert_allclose(res["energies"], [[-1.0, -2.0, -3.0, -4.0, -5.0], [1.0, 2.0, 3.0, 4.0, 5.0]])
+    assert res["atomic_inputs"].shape == (5, 5)
+    assert res["atomic_inputs"].dtype == np.float32
+    np.testing.assert_array_equal(res["atomic_inputs"][:, 0], [8, 1, 1, 6, 7])
+    np.testing.assert_array_equal(res["atomic_inputs"][:, 1], 0)
+    np.testing.assert_allclose(res["atomic_inputs"][3, 2:], [1.34234893, 4.15623617, -3.27245665], rtol=1e-6)
+
+
+def test_metcalf_read_xyz_empty(tmp_path):
+    path = tmp_path / "empty.xyz"
+    path.write_text("")
+    assert read_xyz(str(path), "metcalf") is None
+
+
+def test_metcalf_read_raw_entries_skips_empty(metcalf_xyz, tmp_path, monkeypatch):
+    from types import SimpleNamespace
+
+    from openqdc.datasets.interaction import metcalf
+
+    (tmp_path / "empty.xyz").write_text("")
+    monkeypatch.setattr(metcalf, "extract_raw_tar_gz", lambda folder: None)
+    dataset = SimpleNamespace(root=str(tmp_path), __name__="metcalf")
+    data = metcalf.Metcalf.read_raw_entries(dataset)
+    assert len(data) == 1
+    np.testing.assert_array_equal(data[0]["name"], ["dimer_0", "dimer_1"])
+
+
+def test_symbols_to_atomic_numbers():
+    np.testing.assert_array_equal(symbols_to_atomic_numbers(["C", "H", "Cl", "H"]), [6, 1, 17, 1])
+    np.testing.assert_array_equal(symbols_to_atomic_numbers(np.array([b"O", b"H", b"H"])), [8, 1, 1])
+
+
+def test_pack_atomic_inputs():
+    res = pack_atomic_inputs(np.array([[8], [1]]), np.arange(6.0).reshape(2, 3))
+    assert res.dtype == np.float32
+    np.testing.assert_array_equal(res, [[8, 0, 0, 1, 2], [1, 0, 3, 4, 5]])
+
+
+def _ragged(*arrays):
+    x = np.empty(len(arrays), dtype=object)
+    x[:] = list(arrays)
+    return x
+
+
+@pytest.fixture
+def qc_archive_h5(tmp_path):
+    path = str(tmp_path / "archive.h5")
+    with h5py.File(path, "w") as f:
+        g = f.create_group("data")
+        g.create_dataset("molecule_id", data=np.arange(2))
+        g.create_dataset("name", data=np.array([b"water", b"cyanide"]))
+        g.create_dataset(
+            "symbols",
+            data=_ragged(np.array([b"O", b"H", b"H"]), np.array([b"C", b"N"])),
+            dtype=h5py.vlen_dtype(np.dtype("S2")),
+        )
+        g.create_dataset("geometry", data=_ragged(np.arange(9.0), np.arange(6.0)), dtype=h5py.vlen_dtype(np.float64))
+        g.create_dataset("energy", data=np.array([-1.0, -2.0]))
+        g.create_dataset("gradient", data=_ragged(np.ones(9), np.array([])), dtype=h5py.vlen_dtype(np.float64))
+    return path
+
+
+@pytest.mark.parametrize("subset", ["archive", None])
+def test_read_qc_archive_h5(qc_archive_h5, subset):
+    (res,) = read_qc_archive_h5(qc_archive_h5, subset, ["energy"], ["gradient"])
+    np.testing.assert_array_equal(res["n_atoms"], [3, 2])
+    np.testing.assert_array_equal(res["name"], [b"water", b"cyanide"])
+    np.testing.assert_array_equal(res["subset"], ["archive"] * 2 if subset else ["H2O", "CN"])
+    np.testing.assert_array_equal(res["energies"], [[-1.0], [-2.0]])
+    np.testing.assert_array_equal(res["atomic_inputs"][:, 0], [8, 1, 1, 6, 7])
+    np.testing.assert_array_equal(res["atomic_inputs"][3:, 2:], np.arange(6.0).reshape(-1, 3))
+    assert res["forces"].shape == (5, 3, 1)
+    np.testing.assert_array_equal(res["forces"][:3], 1.0)
+    assert np.isnan(res["forces"][3:]).all()
+
+
+def test_decompress_tar_gz_once(tmp_path, monkeypatch):
+    (tmp_path / "mol.xyz").write_text("1\n\nH 0.0 0.0 0.0\n")
+    archive = str(tmp_path / "mols.tar.gz")
+    with tarfile.open(archive, "w:gz") as tar:
+        tar.add(str(tmp_path / "mol.xyz"), arcname="extracted/mol.xyz")
+
+    decompress_tar_gz(archive)
+    assert (tmp_path / "extracted" / "mol.xyz").exists()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("archive should not be opened again")
+
+    monkeypatch.setattr(tarfile, "open", fail)
+    decompress_tar_gz(archive)
+    monkeypatch.undo()
+
+    # the marker does not hide files removed since the extraction
+    shutil.rmtree(tmp_path / "extracted")
+    decompress_tar_gz(archive)
+    assert (tmp_path / "extracted" / "mol.xyz").exists()
+
+
+def test_cached_raw_entries(tmp_path):
+    source = tmp_path / "raw.txt"
+    source.write_text("raw")
+    cache_dir = str(tmp_path / "raw_entries")
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return {"energies": np.arange(4.0), "name": np.array(["a", "b", "c", "d"])}
+
+    first = cached_raw_entries(cache_dir, loader, lambda: [str(source)])
+    second = cached_raw_entries(cache_dir, loader, lambda: [str(source)])
+    assert len(calls) == 1
+    assert isinstance(second["energies"], np.memmap)
+    for key in first:
+        np.testing.assert_array_equal(first[key], second[key])
+
+    # modifying a source file invalidates the cache
+    os.utime(source, (0, 0))
+    cached_raw_entries(cache_dir, loader, lambda: [str(source)])
+    assert len(calls) == 2
+
+    # so does changing the settings the entries are read with
+    cached_raw_entries(cache_dir, loader, lambda: [str(source)], (["energy"], []))
+    assert len(calls) == 3
+    cached_raw_entries(cache_dir, loader, lambda: [str(source)], (["energy"], []))
+    assert len(calls) == 3
+
+
+def test_pull_many_locally(tmp_path, monkeypatch):
+    import openqdc.utils.io as ioqdc
+
+    calls = []
+    monkeypatch.setattr(ioqdc.API, "get_files", lambda remote, local: calls.append(local))
+    present, missing = str(tmp_path / "present.mmap"), str(tmp_path / "sub" / "missing.mmap")
+    open(present, "w").close()
+
+    ioqdc.pull_many_locally([present, missing])
+    assert calls == [[missing]]
+    assert os.path.isdir(tmp_path / "sub")
+
+    ioqdc.pull_many_locally([present], overwrite=True)
+    assert calls[-1] == [present]
+
+
+def test_read_qc_archive_h5_groups(qc_archive_h5):
+    with h5py.File(qc_archive_h5, "a") as f:
+        f.copy("data", "data_copy")
+    res = read_qc_archive_h5(qc_archive_h5, "archive", ["energy"])
+    assert len(res) == 2
+    for entry in res:
+        np.testing.assert_array_equal(entry["n_atoms"], [3, 2])
+        assert "forces" not in entry
+
+
+def test_copy_exists_caches_remote_hits(tmp_path, monkeypatch):
+    import openqdc.utils.io as ioqdc
+
+    calls = []
+
+    def exists(path):
+        calls.append(path)
+        return path.endswith("present.mmap")
+
+    monkeypatch.setattr(ioqdc.API, "exists", exists)
+    monkeypatch.setattr(ioqdc, "_REMOTE_EXIST_CACHE", set())
+    for _ in range(2):
+        assert ioqdc.copy_exists(str(tmp_path / "present.mmap"))
+        assert not ioqdc.copy_exists(str(tmp_path / "missing.mmap"))
+    assert len(calls) == 3